@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""End-to-end throughput benchmark for clanim animations.
+
+Each animation is written as fast as possible into a pseudo-terminal, while a
+reader thread drains the other end. For every combination of animation, width
+and output strategy, the following is measured:
+
+* frames/s: frames per second, until the reader has received the last byte.
+* bytes/s: bytes per second that pass through the pty.
+* writes/frame: write(2) calls per frame.
+* latency: time from starting to write a frame until the reader has received
+  all of it (median and 99th percentile).
+
+The output strategies are:
+
+* redraw: write the full frame, cursor back up included, to a text stream and
+  flush it. This is what clanimtk does.
+* single_write: encode the full frame and write it with a single os.write.
+* delta: only write the cells that changed since the previous frame, using
+  relative cursor movements.
+* pre_encoded: encode one period of frames up front with
+  clanim.output.EncodedAnimation, and write each frame with a single os.write.
+
+Run from the project root:
+
+.. code-block:: bash
+
+    python benchmarks/pty_throughput.py --frames 2000 --widths 10,80,200
+
+.. moduleauthor:: Simon Larsén <slarse@kth.se>
+"""
+import argparse
+import bisect
+import io
+import itertools
+import os
+import pty
+import statistics
+import sys
+import threading
+import time
+import tty
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from clanim import singleline  # pylint: disable=wrong-import-position
+from clanim import multiline  # pylint: disable=wrong-import-position
+from clanim import output  # pylint: disable=wrong-import-position
+from clanim import framestore  # pylint: disable=wrong-import-position
+
+ANIMATIONS = {
+    'spinner': (singleline.spinner, ()),
+    'arrow': (singleline.arrow, ()),
+    'char_wave': (singleline.char_wave, ()),
+    'spinners': (multiline.spinners, ()),
+    'arrows': (multiline.arrows, ()),
+    'scrolling_text': (multiline.scrolling_text,
+                       ('The quick brown fox jumps over the lazy dog!',)),
+}
+
+
+class _CountingFileIO(io.FileIO):
+    """A FileIO that counts its write calls, each of which is a syscall, and
+    the bytes written.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.writes = 0
+        self.bytes_written = 0
+
+    def write(self, b):
+        written = super().write(b)
+        self.writes += 1
+        self.bytes_written += written
+        return written
+
+
+class _Reader(threading.Thread):
+    """Drains the master end of the pty, and records the time at which each
+    chunk arrived along with the total amount of bytes received so far.
+    """
+
+    def __init__(self, fd):
+        super().__init__(daemon=True)
+        self._fd = fd
+        self._expected = None
+        self._received_all = threading.Event()
+        self.timestamps = []
+        self.totals = []
+
+    def run(self):
+        total = 0
+        while True:
+            try:
+                chunk = os.read(self._fd, 1 << 16)
+            except OSError:  # the slave end was closed
+                break
+            if not chunk:
+                break
+            total += len(chunk)
+            self.timestamps.append(time.perf_counter())
+            self.totals.append(total)
+            if self._expected is not None and total >= self._expected:
+                self._received_all.set()
+
+    def wait_for(self, total):
+        """Block until the given amount of bytes has been received."""
+        self._expected = total
+        if self.totals and self.totals[-1] >= total:
+            return
+        self._received_all.wait()
+
+    def arrival_time(self, total):
+        """Return the time at which the reader had received the given amount
+        of bytes.
+        """
+        return self.timestamps[bisect.bisect_left(self.totals, total)]
+
+
+def _redraw(fd, frames):
+    """Write each frame to a text stream and flush it."""
+    raw = _CountingFileIO(fd, 'w', closefd=False)
+    stream = io.TextIOWrapper(io.BufferedWriter(raw), encoding='utf-8')
+    for frame in frames:
+        stream.write(frame)
+        stream.flush()
+        yield raw.writes, raw.bytes_written
+
+
+def _single_write(fd, frames):
+    """Encode each frame and write it with a single os.write."""
+    writes = 0
+    total = 0
+    for frame in frames:
+        data = frame.encode('utf-8')
+        writes += framestore.write_all(fd, data)
+        total += len(data)
+        yield writes, total
+
+
+def _delta(fd, frames):
+    """Write only the changed cells of each raw frame."""
+    writes = 0
+    total = 0
+    previous = None
+    for frame in frames:
+        rows = frame.split('\n')
+        if previous is None:
+            previous = [' ' * len(row) for row in rows]
+        data = _delta_frame(previous, rows).encode('utf-8')
+        if data:  # nothing changed since the previous frame
+            writes += framestore.write_all(fd, data)
+        total += len(data)
+        previous = rows
+        yield writes, total
+
+
+def _delta_frame(previous, current):
+    """Return the cursor movements and cells needed to turn the previous
+    frame into the current one. The cursor starts and ends in the top left
+    corner of the frame.
+    """
+    parts = []
+    cursor_row = 0
+    for row, (old, new) in enumerate(zip(previous, current)):
+        if old == new:
+            continue
+        start = 0
+        while old[start] == new[start]:
+            start += 1
+        end = len(new)
+        while old[end - 1] == new[end - 1]:
+            end -= 1
+        if row > cursor_row:
+            parts.append('\033[{}B'.format(row - cursor_row))
+            cursor_row = row
+        if start:
+            parts.append('\033[{}C'.format(start))
+        parts.append(new[start:end])
+        parts.append('\033[{}D'.format(end))
+    if cursor_row:
+        parts.append('\033[{}A'.format(cursor_row))
+    return ''.join(parts)
+
+
+def _pre_encoded(fd, frames):
+    """Write the pre-encoded frames of an EncodedAnimation."""
+    writes = 0
+    total = 0
+    for view in frames:
+        writes += framestore.write_all(fd, view)
+        total += len(view)
+        yield writes, total
+
+
+# strategy name -> (strategy, kind of frames that it takes)
+STRATEGIES = {
+    'redraw': (_redraw, 'animation'),
+    'single_write': (_single_write, 'animation'),
+    'delta': (_delta, 'raw'),
+    'pre_encoded': (_pre_encoded, 'encoded'),
+}
+
+
+def _frames(animation, args, width, num_frames, kind):
+    if kind == 'raw':
+        return (animation.frame_at(index, *args, width=width)
+                for index in range(num_frames))
+    if kind == 'encoded':
+        encoded = output.EncodedAnimation(animation, *args, width=width)
+        views = itertools.cycle(encoded.frames.views())
+        return itertools.islice(views, num_frames)
+    animation_ = animation(*args, width=width)
+    return (next(animation_) for _ in range(num_frames))
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(animation_name, width, strategy_name, num_frames):
+    """Run a single benchmark.
+
+    Args:
+        animation_name: A key in ANIMATIONS.
+        width: Width of the animation.
+        strategy_name: A key in STRATEGIES.
+        num_frames: The amount of frames to write.
+    Returns:
+        a dict with the results.
+    """
+    animation, args = ANIMATIONS[animation_name]
+    strategy, kind = STRATEGIES[strategy_name]
+    frames = _frames(animation, args, width, num_frames, kind)
+
+    master, slave = pty.openpty()
+    tty.setraw(slave)
+    reader = _Reader(master)
+    reader.start()
+    start_times = []
+    totals = []
+    writes = total = 0
+    try:
+        frame_writes = strategy(slave, frames)
+        start = time.perf_counter()
+        while True:
+            frame_start = time.perf_counter()
+            previous_total = total
+            try:
+                writes, total = next(frame_writes)
+            except StopIteration:
+                break
+            if total > previous_total:  # delta frames may write nothing
+                start_times.append(frame_start)
+                totals.append(total)
+        reader.wait_for(total)
+        elapsed = reader.arrival_time(total) - start
+    finally:
+        os.close(slave)
+        reader.join()
+        os.close(master)
+    latencies = [reader.arrival_time(frame_total) - frame_start
+                 for frame_start, frame_total in zip(start_times, totals)]
+    return {
+        'animation': animation_name,
+        'width': width,
+        'strategy': strategy_name,
+        'frames/s': num_frames / elapsed,
+        'bytes/s': total / elapsed,
+        'writes/frame': writes / num_frames,
+        'p50 latency (us)': statistics.median(latencies) * 1e6,
+        'p99 latency (us)': _percentile(latencies, 0.99) * 1e6,
+    }
+
+
+def _print_table(results):
+    columns = list(results[0])
+    cells = [[_format(result[column]) for column in columns]
+             for result in results]
+    widths = [max(len(column), *(len(row[i]) for row in cells))
+              for i, column in enumerate(columns)]
+    print('  '.join(column.rjust(width)
+                    for column, width in zip(columns, widths)))
+    for row in cells:
+        print('  '.join(cell.rjust(width) for cell, width in zip(row, widths)))
+
+
+def _format(value):
+    if isinstance(value, float):
+        return '{:.1f}'.format(value) if value < 100 else '{:.0f}'.format(value)
+    return str(value)
+
+
+def _parse_args(args):
+    parser = argparse.ArgumentParser(
+        description='Benchmark clanim animations written to a pty.')
+    parser.add_argument('--frames', type=int, default=2000,
+                        help='Frames to write per benchmark.')
+    parser.add_argument('--widths', default='10,80,200',
+                        help='Comma separated animation widths.')
+    parser.add_argument('--animations', default=','.join(ANIMATIONS),
+                        help='Comma separated animations to benchmark.')
+    parser.add_argument('--strategies', default=','.join(STRATEGIES),
+                        help='Comma separated output strategies.')
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    args = _parse_args(args)
+    results = []
+    for animation_name in args.animations.split(','):
+        for width in map(int, args.widths.split(',')):
+            for strategy_name in args.strategies.split(','):
+                results.append(
+                    run(animation_name, width, strategy_name, args.frames))
+    _print_table(results)
+
+
+if __name__ == '__main__':
+    main()
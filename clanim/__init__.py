@@ -1,5 +1,7 @@
 from clanim.singleline import spinner, arrow, char_wave
 from clanim.multiline import spinners, arrows, char_waves, scrolling_text
+from clanim.multiline import live_scrolling_text
+from clanim.alnum import MessageQueue
 
-__all__ = 'spinner arrow char_wave spinners arrows char_waves scrolling_text'\
-        .split()
+__all__ = ('spinner arrow char_wave spinners arrows char_waves scrolling_text '
+           'live_scrolling_text MessageQueue').split()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: aio
+    :platform: Unix
+    :synopsis: Asynchronous iteration over animation frames.
+.. moduleauthor:: Simon Larsén <slarse@kth.se>
+"""
+import asyncio
+import sys
+from typing import Iterator
+
+from clanimtk import types
+
+
+class AsyncFrames:
+    """An asynchronous iterator that yields the frames of an animation, paced
+    so that consecutive frames are (approximately) ``step`` seconds apart.
+    Every frame yields control to the event loop, even when no waiting is
+    needed (e.g. with a step of 0), so that other tasks are never starved.
+    Frames are scheduled on absolute deadlines so that the pacing does not
+    drift, but a consumer that falls behind by more than a step does not get
+    a burst of frames to catch up.
+
+    .. DANGER::
+
+        Do not use directly, use the paced function instead.
+    """
+
+    def __init__(self, frames: Iterator[types.Frame], step: float):
+        """
+        Args:
+            frames: An iterator of frames, such as an Animation.
+            step: Seconds between each animation frame.
+        """
+        if step < 0:
+            raise ValueError("step must not be negative")
+        self._frames = frames
+        self._step = step
+        self._deadline = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> types.Frame:
+        now = _get_running_loop().time()
+        if self._deadline is None or now - self._deadline > self._step:
+            self._deadline = now
+        await asyncio.sleep(max(0, self._deadline - now))
+        self._deadline += self._step
+        try:
+            return next(self._frames)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+def paced(animation_: Iterator[types.Frame],
+          step: float = 0.1) -> AsyncFrames:
+    """Iterate over an animation with ``async for``, one frame every ``step``
+    seconds. The first frame is yielded immediately.
+
+    .. code-block:: python
+
+        async for frame in paced(scrolling_text("Hello"), step=0.05):
+            writer.write(frame.encode())
+            await writer.drain()
+
+    Args:
+        animation_: An animation, or any other iterator of frames.
+        step: Seconds between each animation frame.
+    Returns:
+        an asynchronous iterator over the frames of the animation.
+    """
+    return AsyncFrames(iter(animation_), step)
+
+
+def _get_running_loop():
+    if sys.version_info < (3, 7):
+        return asyncio.get_event_loop()
+    return asyncio.get_running_loop()
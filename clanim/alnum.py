@@ -5,7 +5,58 @@
     :synopsis: This module contains iterables for alphanumerical characters.
 .. moduleauthor:: Simon Larsén <slarse@kth.se>
 """
-from clanim.big_char import CHARS
+import collections
+import functools
+import threading
+from clanim.big_char import CHARS, CHAR_HEIGHT
+
+_BLANK_COLUMN = (' ',)*CHAR_HEIGHT
+_SEPARATOR_WIDTH = 2
+
+
+@functools.lru_cache(maxsize=32)
+def _scroll_lines(msg, width):
+    """Return the full scroll stream of the message as one string per line,
+    along with the length of the leading whitespace padding. Frame ``i`` of
+    the big message is the ``width`` last cells of the first ``padding + i + 1``
+    cells of each line.
+    """
+    chars_per_width = (width - 2)//7
+    big_chars = [CHARS[char.upper()] for char in msg]
+    padding = '  '.join(' '*5)*chars_per_width
+    lines = tuple(padding
+                  + '  '.join(big_char[line] for big_char in big_chars)
+                  + ' '*width
+                  for line in range(CHAR_HEIGHT))
+    return len(padding), lines
+
+
+def big_message_period(msg, width=50):
+    """Return the amount of frames in the big message animation.
+
+    Args:
+        msg (str): The message to render as scrolling text.
+        width (int): Width of the animation.
+    """
+    padding, lines = _scroll_lines(msg, width)
+    return len(lines[0]) - padding
+
+
+def big_message_frame_at(index, msg, width=50):
+    """Return the frame at the given index of the big message animation,
+    without generating any of the preceding frames. The index wraps around
+    at the period of the animation.
+
+    Args:
+        index (int): Index of the frame.
+        msg (str): The message to render as scrolling text.
+        width (int): Width of the animation.
+    """
+    padding, lines = _scroll_lines(msg, width)
+    end = padding + index % (len(lines[0]) - padding) + 1
+    start = max(0, end - width)
+    return '\n'.join(line[start:end] for line in lines)
+
 
 def big_message(msg, width=50):
     """Yields strings that animate large scrolling text, followed by whitespace
@@ -15,24 +66,94 @@ def big_message(msg, width=50):
         msg (str): The message to render as scrolling text.
         width (int): Width of the animation.
     """
-    chars_per_width = (width - 2)//7
-    big_chars = [CHARS[char.upper()] for char in msg]
-    char_size = len(big_chars[0])
-    num_chars = len(big_chars)
-    seq = ['  '.join([big_chars[char][line] for char in range(num_chars)])
-           for line in range(char_size)]
-    accum = ['  '.join(' '*5)*chars_per_width]*5
-    # yield the text
-    for i in range(len(seq[0])):
-        column = [line[i] for line in seq]
-        accum = [accum[j] + column[j] for j in range(len(column))]
-        accum = [line[-width:] for line in accum]
-        next_ = '\n'.join(accum)
-        yield next_
-    # yield one width's worth of whitespace
-    for _ in range(width):
-        column = [' ']*5
-        accum = [accum[j] + column[j] for j in range(len(column))]
-        accum = [line[-width:] for line in accum]
-        next_ = '\n'.join(accum)
-        yield next_
+    for index in range(big_message_period(msg, width)):
+        yield big_message_frame_at(index, msg, width)
+
+
+class MessageQueue:
+    """A thread-safe queue of messages for :py:func:`live_big_message`. The
+    messages are rendered lazily, one big character at a time, as the
+    animation scrolls them in.
+    """
+
+    def __init__(self, msg=''):
+        """
+        Args:
+            msg (str): An initial message.
+        """
+        self._lock = threading.Lock()
+        self._big_chars = collections.deque()
+        self._columns = collections.deque()
+        self.put(msg)
+
+    def put(self, msg):
+        """Append a message to the scroll stream.
+
+        Args:
+            msg (str): The message to append.
+        Raises:
+            ValueError if the message contains characters that are not
+            available as big characters.
+        """
+        big_chars = _to_big_chars(msg)
+        with self._lock:
+            self._big_chars.extend(big_chars)
+
+    def replace(self, msg):
+        """Replace all text that has not yet started scrolling in with the
+        given message. Text that is already visible, including a partially
+        visible character, keeps scrolling.
+
+        Args:
+            msg (str): The message to replace the pending text with.
+        Raises:
+            ValueError if the message contains characters that are not
+            available as big characters.
+        """
+        big_chars = _to_big_chars(msg)
+        with self._lock:
+            self._big_chars.clear()
+            self._big_chars.extend(big_chars)
+
+    def clear(self):
+        """Drop all text that has not yet started scrolling in."""
+        self.replace('')
+
+    def next_column(self):
+        """Return the next column of cells to scroll in, or None if the queue
+        is empty.
+        """
+        with self._lock:
+            if not self._columns:
+                if not self._big_chars:
+                    return None
+                big_char = self._big_chars.popleft()
+                self._columns.extend(zip(*big_char))
+                self._columns.extend([_BLANK_COLUMN]*_SEPARATOR_WIDTH)
+            return self._columns.popleft()
+
+
+def _to_big_chars(msg):
+    unsupported = sorted({char for char in msg if char.upper() not in CHARS})
+    if unsupported:
+        raise ValueError("unsupported characters: {}".format(
+            ', '.join(map(repr, unsupported))))
+    return [CHARS[char.upper()] for char in msg]
+
+
+def live_big_message(queue, width=50):
+    """Yields strings that animate large scrolling text taken from a
+    :py:class:`MessageQueue`. Blank columns are scrolled in while the queue is
+    empty, so the generator is endless. The first frame is blank and does not
+    take anything from the queue.
+
+    Args:
+        queue (MessageQueue): The queue to take messages from.
+        width (int): Width of the animation.
+    """
+    lines = [' '*width]*CHAR_HEIGHT
+    yield '\n'.join(lines)
+    while True:
+        column = queue.next_column() or _BLANK_COLUMN
+        lines = [(line + cell)[1:] for line, cell in zip(lines, column)]
+        yield '\n'.join(lines)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: broadcast
+    :platform: Unix
+    :synopsis: Fan-out of one animation's frames to many consumers.
+.. moduleauthor:: Simon Larsén <slarse@kth.se>
+"""
+import collections
+import queue
+import threading
+from typing import Iterator, Optional
+
+from clanimtk import types
+
+
+class Subscription:
+    """A bounded buffer of frames for a single consumer of a
+    :py:class:`Broadcast`. When the buffer is full, the oldest frame is
+    dropped to make room for the newest one, so a slow consumer never holds
+    up the broadcast or any other consumer.
+
+    .. DANGER::
+
+        Do not create directly, use Broadcast.subscribe instead.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize: The maximum amount of buffered frames.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        self._frames = collections.deque(maxlen=maxsize)
+        self._condition = threading.Condition()
+        self._closed = False
+        self.dropped = 0
+
+    @property
+    def closed(self) -> bool:
+        """True if no more frames will be put in the buffer."""
+        return self._closed
+
+    def get(self, timeout: Optional[float] = None) -> Optional[types.Frame]:
+        """Remove and return the oldest buffered frame, waiting for one if the
+        buffer is empty.
+
+        Args:
+            timeout: Maximum amount of seconds to wait. Waits indefinitely if
+            None.
+        Returns:
+            the oldest buffered frame, or None if the subscription is closed
+            and there are no more buffered frames.
+        Raises:
+            queue.Empty if no frame arrived within the timeout.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                    lambda: self._frames or self._closed, timeout):
+                raise queue.Empty
+            return self._frames.popleft() if self._frames else None
+
+    def _put(self, frame):
+        with self._condition:
+            if len(self._frames) == self._frames.maxlen:
+                self.dropped += 1
+            self._frames.append(frame)
+            self._condition.notify()
+
+    def _close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def __iter__(self):
+        while True:
+            frame = self.get()
+            if frame is None:
+                return
+            yield frame
+
+
+class Broadcast:
+    """Computes each frame of an animation once, and fans it out to any
+    number of subscribers. Frames are pushed by calling :py:meth:`publish`,
+    or by running :py:meth:`run` in a thread.
+
+    .. code-block:: python
+
+        broadcast = Broadcast(scrolling_text("Deploying"))
+        terminal = broadcast.subscribe()
+        log = broadcast.subscribe(maxsize=64)
+        event = threading.Event()
+        threading.Thread(target=broadcast.run, args=(0.1, event)).start()
+    """
+
+    def __init__(self, animation_: Iterator[types.Frame]):
+        """
+        Args:
+            animation_: An animation, or any other iterator of frames.
+        """
+        self._frames = iter(animation_)
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def subscribe(self, maxsize: int = 16) -> Subscription:
+        """Add a subscriber. It receives every frame that is published from
+        now on, unless it falls more than maxsize frames behind.
+
+        Args:
+            maxsize: The maximum amount of frames to buffer for the
+            subscriber.
+        Returns:
+            a Subscription to get frames from.
+        """
+        subscription = Subscription(maxsize)
+        with self._lock:
+            if self._closed:
+                subscription._close()
+            else:
+                self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove a subscriber and close its subscription. Frames that are
+        already buffered can still be consumed. Does nothing if the
+        subscription has already been removed, e.g. because the broadcast
+        is closed.
+        """
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+        subscription._close()
+
+    def publish(self) -> Optional[types.Frame]:
+        """Compute the next frame and put it in the buffer of every
+        subscriber. If the animation is exhausted, all subscriptions are
+        closed.
+
+        Returns:
+            the published frame, or None if the animation is exhausted.
+        """
+        with self._lock:
+            if self._closed:
+                return None
+            try:
+                frame = next(self._frames)
+            except StopIteration:
+                self._close()
+                return None
+            for subscription in self._subscribers:
+                subscription._put(frame)
+        return frame
+
+    def run(self, step: float, event: threading.Event):
+        """Publish a frame every step seconds until the event is set or the
+        animation is exhausted, and then close all subscriptions. This
+        function is meant to be run in a thread.
+
+        Args:
+            step: Seconds between each frame.
+            event: An event that stops the broadcast when set.
+        """
+        while self.publish() is not None:
+            if event.wait(step):
+                break
+        self.close()
+
+    def close(self):
+        """Stop the broadcast and close all subscriptions."""
+        with self._lock:
+            self._close()
+
+    def _close(self):
+        self._closed = True
+        for subscription in self._subscribers:
+            subscription._close()
+        self._subscribers = []
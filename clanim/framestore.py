@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: framestore
+    :platform: Unix
+    :synopsis: Compact storage for pre-rendered animation frames.
+.. moduleauthor:: Simon Larsén <slarse@kth.se>
+"""
+import os
+from array import array
+from typing import Iterable, Tuple, Union
+
+
+def write_all(fd: int, data: Union[bytes, memoryview]) -> int:
+    """Write all of data to a file descriptor. This is a single ``os.write``,
+    unless the write is partial, in which case the rest is written with
+    further calls.
+
+    Args:
+        fd: A file descriptor open for writing.
+        data: The bytes to write, for example a view from a FrameStore.
+    Returns:
+        the amount of ``os.write`` calls that were made.
+    """
+    writes = 1
+    written = os.write(fd, data)
+    while written < len(data):
+        written += os.write(fd, data[written:])
+        writes += 1
+    return writes
+
+
+class FrameStore:
+    """An immutable sequence of frames that are stored encoded in a single,
+    contiguous buffer. Frame ``i`` occupies the bytes between ``offsets[i]``
+    and ``offsets[i+1]`` of the buffer, so the per-frame overhead is a single
+    machine integer instead of a full ``str`` object.
+
+    Indexing a FrameStore decodes the frame back into a ``str``. To avoid
+    decoding altogether, use :py:meth:`view` or :py:meth:`write`, which hand
+    out zero-copy ``memoryview`` slices of the buffer.
+    """
+
+    def __init__(self, frames: Iterable[str], encoding: str = 'utf-8'):
+        """
+        Args:
+            frames: A finite iterable of frames.
+            encoding: The encoding to store the frames in.
+        """
+        buffer = bytearray()
+        offsets = array('I', [0])
+        for frame in frames:
+            buffer += frame.encode(encoding)
+            offsets.append(len(buffer))
+        self._buffer = bytes(buffer)
+        self._offsets = offsets
+        self._encoding = encoding
+        self._memory = memoryview(self._buffer)
+        self._views = None
+
+    @property
+    def encoding(self) -> str:
+        """The encoding that the frames are stored in."""
+        return self._encoding
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the encoded frames in bytes."""
+        return len(self._buffer)
+
+    def view(self, index: int) -> memoryview:
+        """Return a zero-copy view of the encoded frame at the given index.
+
+        Args:
+            index: Index of the frame. Negative indices are allowed.
+        Returns:
+            a read-only memoryview of the encoded frame.
+        """
+        start, end = self._bounds(index)
+        return self._memory[start:end]
+
+    def views(self) -> Tuple[memoryview, ...]:
+        """Return zero-copy views of all encoded frames. The views are created
+        on the first call and then reused, so that iterating over them
+        repeatedly does not allocate anything.
+        """
+        if self._views is None:
+            self._views = tuple(self.view(index) for index in range(len(self)))
+        return self._views
+
+    def write(self, fd: int, index: int) -> int:
+        """Write the encoded frame at the given index to a file descriptor.
+        Partial writes are retried until the whole frame has been written.
+
+        Args:
+            fd: A file descriptor open for writing.
+            index: Index of the frame.
+        Returns:
+            the amount of bytes written.
+        """
+        view = self.view(index)
+        write_all(fd, view)
+        return len(view)
+
+    def _bounds(self, index):
+        num_frames = len(self)
+        if index < 0:
+            index += num_frames
+        if not 0 <= index < num_frames:
+            raise IndexError("frame index out of range")
+        return self._offsets[index], self._offsets[index + 1]
+
+    def __getitem__(self, index: int) -> str:
+        return str(self.view(index), self._encoding)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
@@ -4,12 +4,77 @@
     :synopsis: Multiline animations.
 .. moduleauthor:: Simon Larsén <slarse@kth.se>
 """
+from typing import Optional
 from clanimtk import animation
 from clanimtk import types
 from clanimtk.util import concatechain
 from clanimtk.decorator import multiline_frame_function
 from clanim.singleline import arrow, char_wave, spinner
-from clanim.alnum import big_message
+from clanim.singleline import ARROW_MIN_WIDTH, SPINNER_MIN_WIDTH
+from clanim.alnum import big_message, big_message_frame_at, big_message_period
+from clanim.alnum import live_big_message, MessageQueue
+from clanim.seek import seekable
+from clanim.terminal import default_width, resolve_width
+
+ARROWS_WIDTH = 10
+SPINNERS_WIDTH = 10
+SCROLLING_TEXT_WIDTH = 50
+SCROLLING_TEXT_MIN_WIDTH = 9
+
+
+def _check_height(height):
+    if height <= 0:
+        raise ValueError("height must be greater than 0")
+
+
+def _arrows_period(height: int = 5, width: Optional[int] = None) -> int:
+    width = resolve_width(width, ARROWS_WIDTH, ARROW_MIN_WIDTH)
+    _check_height(height)
+    return arrow.period(width=width)
+
+
+def _arrows_frame_at(index: int,
+                     height: int = 5,
+                     width: Optional[int] = None) -> str:
+    width = resolve_width(width, ARROWS_WIDTH, ARROW_MIN_WIDTH)
+    _check_height(height)
+    return '\n'.join([arrow.frame_at(index, width=width)] * height)
+
+
+def _spinners_period(width: Optional[int] = None, height: int = 3) -> int:
+    width = resolve_width(width, SPINNERS_WIDTH, SPINNER_MIN_WIDTH)
+    _check_height(height)
+    return spinner.period(width=width)
+
+
+def _spinners_frame_at(index: int,
+                       width: Optional[int] = None,
+                       height: int = 3) -> str:
+    width = resolve_width(width, SPINNERS_WIDTH, SPINNER_MIN_WIDTH)
+    _check_height(height)
+    return '\n'.join([spinner.frame_at(index, width=width)] * height)
+
+
+def _check_scrolling_text_width(width):
+    if width < SCROLLING_TEXT_MIN_WIDTH:
+        raise ValueError(
+            "width must be at least {}".format(SCROLLING_TEXT_MIN_WIDTH))
+
+
+def _scrolling_text_period(msg: str, width: Optional[int] = None) -> int:
+    width = resolve_width(width, SCROLLING_TEXT_WIDTH,
+                          SCROLLING_TEXT_MIN_WIDTH)
+    _check_scrolling_text_width(width)
+    return big_message_period(msg, width=width)
+
+
+def _scrolling_text_frame_at(index: int,
+                             msg: str,
+                             width: Optional[int] = None) -> str:
+    width = resolve_width(width, SCROLLING_TEXT_WIDTH,
+                          SCROLLING_TEXT_MIN_WIDTH)
+    _check_scrolling_text_width(width)
+    return big_message_frame_at(index, msg, width=width)
 
 
 @animation
@@ -26,12 +91,15 @@ def char_waves(char:str=  '#', width: int =10, height: int =3) -> types.FrameFun
     return char_wave
 
 
+@seekable(frame_at=_arrows_frame_at, period=_arrows_period)
+@default_width(ARROWS_WIDTH, ARROW_MIN_WIDTH)
 @animation
-def arrows(height: int=5, width: int=10) -> types.FrameFunction:
+def arrows(height: int=5, width: Optional[int]=None) -> types.FrameFunction:
     """Multi line version of the arrow animation.
 
     Args:
-        width: The width of the animation.
+        width: The width of the animation. Defaults to 10, clipped to the
+        terminal width.
         height: The height of the animation.
     Returns:
         a FrameFunction (or an Animation if annotated with ``@animation``)
@@ -39,12 +107,15 @@ def arrows(height: int=5, width: int=10) -> types.FrameFunction:
     return multiline_frame_function(arrow, height, offset=0, width=width)
 
 
+@seekable(frame_at=_spinners_frame_at, period=_spinners_period)
+@default_width(SPINNERS_WIDTH, SPINNER_MIN_WIDTH)
 @animation
-def spinners(width: int=10, height: int=3) -> types.FrameFunction:
+def spinners(width: Optional[int]=None, height: int=3) -> types.FrameFunction:
     """Multi line version of the spinner animation.
 
     Args:
-        width: The width of the animation.
+        width: The width of the animation. Defaults to 10, clipped to the
+        terminal width.
         height: The height of the animation.
     Returns:
         a FrameFunction (or an Animation if annotated with ``@animation``)
@@ -52,8 +123,10 @@ def spinners(width: int=10, height: int=3) -> types.FrameFunction:
     return multiline_frame_function(spinner, height, offset=0, width=width)
 
 
+@seekable(frame_at=_scrolling_text_frame_at, period=_scrolling_text_period)
+@default_width(SCROLLING_TEXT_WIDTH, SCROLLING_TEXT_MIN_WIDTH)
 @animation
-def scrolling_text(msg: str, width: int=50) -> types.FrameFunction:
+def scrolling_text(msg: str, width: Optional[int]=None) -> types.FrameFunction:
     """Animates the given message with big, friendly scrolling characters that
     are 5x5 cells large. See  for available
     characters!
@@ -62,10 +135,36 @@ def scrolling_text(msg: str, width: int=50) -> types.FrameFunction:
 
     Args:
         msg: The message to animate.
-        width: Width (in cells) of the animation.
+        width: Width (in cells) of the animation. Defaults to 50, clipped
+        to the terminal width.
     Returns:
         a FrameFunction (or an Animation if annotated with ``@animation``)
     """
-    if width < 9:
-        raise ValueError("width must be at least 9")
+    _check_scrolling_text_width(width)
     yield from big_message(msg, width=width)
+
+
+@default_width(SCROLLING_TEXT_WIDTH, SCROLLING_TEXT_MIN_WIDTH)
+@animation
+def live_scrolling_text(queue: MessageQueue,
+                        width: Optional[int]=None) -> types.FrameFunction:
+    """Like scrolling_text, but the text is taken from a MessageQueue that can
+    be appended to or replaced while the animation is running, without
+    restarting the animation.
+
+    .. code-block:: python
+
+        queue = MessageQueue("Building")
+        animation = live_scrolling_text(queue)
+        ...
+        queue.replace("Deploying")
+
+    Args:
+        queue: The queue to take the text from.
+        width: Width (in cells) of the animation. Defaults to 50, clipped
+        to the terminal width.
+    Returns:
+        a FrameFunction (or an Animation if annotated with ``@animation``)
+    """
+    _check_scrolling_text_width(width)
+    yield from live_big_message(queue, width=width)
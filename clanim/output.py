@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: output
+    :platform: Unix
+    :synopsis: An output path that writes pre-encoded frames with a single
+        system call per frame.
+.. moduleauthor:: Simon Larsén <slarse@kth.se>
+"""
+import functools
+import itertools
+import sys
+import threading
+from typing import Optional
+
+from clanimtk import types
+from clanimtk.cli import BACKLINE, BACKSPACE
+from clanim.framestore import FrameStore, write_all
+
+
+class EncodedAnimation:
+    """One period of a seekable animation, where each frame is encoded to
+    bytes together with the cursor back up that follows it. As the animation
+    repeats itself after one period, the frames are encoded once and then
+    written as they are, without any per-frame concatenation or encoding.
+
+    The frames are built from ``frame_at``, so for multiline animations that
+    are stacked from singleline Animations (such as ``spinners`` and
+    ``arrows``), the per-line backspaces that the Animation writes are left
+    out. The visible output is the same, but fewer bytes are written.
+
+    .. code-block:: python
+
+        encoded = EncodedAnimation(spinner, width=4)
+
+        @animate(encoded, step=0.1)
+        def slow():
+            ...
+    """
+
+    def __init__(self, animation_: types.Animation, *args, **kwargs):
+        """
+        Args:
+            animation_: A seekable animation (i.e. one that has ``frame_at``
+            and ``period`` attributes).
+            args: Arguments for the animation.
+            kwargs: Keyword arguments for the animation.
+        """
+        if not (hasattr(animation_, 'frame_at')
+                and hasattr(animation_, 'period')):
+            raise TypeError("animation {!r} is not seekable".format(
+                getattr(animation_, '__name__', animation_)))
+        period = animation_.period(*args, **kwargs)
+        first_frame = animation_.frame_at(0, *args, **kwargs)
+        back_up = _back_up(first_frame)
+        self.frames = FrameStore(
+            animation_.frame_at(index, *args, **kwargs) + back_up
+            for index in range(period))
+        self.erase_frame = _erase_frame(first_frame).encode(
+            self.frames.encoding)
+
+    def play(self, step: float, event: threading.Event,
+             fd: Optional[int] = None):
+        """Write the animation to a file descriptor until the event is set,
+        and then erase it. Each frame is written with a single ``os.write``
+        (unless the write is partial). This function is for use with
+        synchronous functions and must be run in a thread.
+
+        Args:
+            step: Seconds between each animation frame.
+            event: An event that stops the animation when set.
+            fd: The file descriptor to write to. Defaults to that of
+            sys.stdout.
+        """
+        if fd is None:
+            sys.stdout.flush()  # don't interleave with buffered output
+            fd = sys.stdout.fileno()
+        for view in itertools.cycle(self.frames.views()):
+            write_all(fd, view)
+            if event.wait(step):
+                break
+        write_all(fd, self.erase_frame)
+
+
+def animate(encoded: EncodedAnimation,
+            step: float = 0.1,
+            fd: Optional[int] = None) -> types.AnyFunction:
+    """Decorator that plays an EncodedAnimation while the decorated
+    (synchronous) function runs. This is the counterpart of
+    ``clanimtk.animate`` for pre-encoded animations.
+
+    Args:
+        encoded: The animation to play.
+        step: Seconds between each animation frame.
+        fd: The file descriptor to write to. Defaults to that of sys.stdout.
+    Returns:
+        a decorator that animates a function.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            event = threading.Event()
+            thread = threading.Thread(target=encoded.play,
+                                      args=(step, event, fd),
+                                      daemon=True)
+            thread.start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                event.set()
+                thread.join()
+
+        return wrapper
+
+    return decorator
+
+
+def _back_up(frame):
+    """Return the characters that back the cursor up to the top left corner
+    of the frame, after the frame has been written.
+    """
+    lines = frame.split('\n')
+    if len(lines) == 1:
+        return BACKSPACE * len(frame)
+    return BACKLINE * (len(lines) - 1)
+
+
+def _erase_frame(frame):
+    """Return a frame that erases the given frame, and then backs up."""
+    lines = frame.split('\n')
+    blank = ' ' * len(lines[0])
+    if len(lines) == 1:
+        return blank + BACKSPACE * len(blank)
+    return '\n'.join([blank] * len(lines)) + BACKLINE * (len(lines) - 1)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: seek
+    :platform: Unix
+    :synopsis: Random access to the frames of an animation.
+.. moduleauthor:: Simon Larsén <slarse@kth.se>
+"""
+from typing import Callable
+
+from clanimtk import types
+
+FrameAt = Callable[..., types.Frame]
+Period = Callable[..., int]
+
+
+def seekable(frame_at: FrameAt, period: Period) -> types.AnyFunction:
+    """Decorator that makes an animation seekable by attaching a ``frame_at``
+    and a ``period`` function to it. Both take the same arguments as the
+    animation itself, ``frame_at`` with the frame index prepended. Indices
+    wrap around, so ``frame_at(i)`` is the frame that is shown after ``i``
+    calls to ``next()`` on the animation. The returned frames only contain
+    what is visible, and no cursor control characters. That is, they leave
+    out the cursor back up that the Animation appends to each frame. For
+    multiline animations that are stacked from singleline Animations (such
+    as ``spinners`` and ``arrows``), they also leave out the backspaces that
+    end each line.
+
+    .. code-block:: python
+
+        @seekable(frame_at=_spinner_frame_at, period=_spinner_period)
+        @animation
+        def spinner(width=10):
+            ...
+
+        spinner.frame_at(1000, width=4)  # same as the 1001st frame
+        spinner.period(width=4)  # 16
+
+    Args:
+        frame_at: A function that takes a frame index followed by the
+        arguments of the animation, and returns the frame at that index.
+        period: A function that takes the arguments of the animation and
+        returns the amount of frames before the animation repeats itself.
+    Returns:
+        a decorator that attaches ``frame_at`` and ``period`` to an animation.
+    """
+    def decorator(animation_):
+        animation_.frame_at = frame_at
+        animation_.period = period
+        return animation_
+
+    return decorator
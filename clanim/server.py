@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: server
+    :platform: Unix
+    :synopsis: A frame server that renders animations on behalf of other
+        processes.
+.. moduleauthor:: Simon Larsén <slarse@kth.se>
+
+A single :py:class:`FrameServer` owns the terminal and renders one animation
+per connected client. Clients connect over a Unix domain socket and only send
+status updates, one JSON object per line:
+
+.. code-block:: bash
+
+    {"status": "Crunching numbers"}
+
+The client's animation is removed when it disconnects.
+"""
+import errno
+import itertools
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import threading
+from typing import Optional, TextIO
+
+from clanimtk import types
+from clanimtk.cli import BACKLINE
+from clanim import terminal
+from clanim.singleline import spinner
+
+ERASE_LINE = '\033[K'
+ERASE_DOWN = '\033[J'
+
+
+class _StatusHandler(socketserver.StreamRequestHandler):
+    """Reads status updates from a single client until it disconnects."""
+
+    def handle(self):
+        frame_server = self.server.frame_server
+        client = frame_server._connect(self.request)
+        if client is None:
+            return  # the server is stopping
+        try:
+            for line in self.rfile:
+                try:
+                    message = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    continue  # skip malformed updates
+                if isinstance(message, dict) and 'status' in message:
+                    frame_server._update(client,
+                                         _sanitize(message['status']))
+        finally:
+            frame_server._disconnect(client)
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, frame_server):
+        self.frame_server = frame_server
+        super().__init__(path, _StatusHandler)
+
+
+class FrameServer:
+    """Renders a seekable animation followed by a status message for each
+    connected client. All clients share the same frame index, so each frame
+    costs one ``frame_at`` lookup per client and a single write to the
+    output stream.
+
+    .. code-block:: python
+
+        with FrameServer('/tmp/clanim.sock', step=0.1):
+            run_workers()
+    """
+
+    def __init__(self,
+                 path: str,
+                 animation: types.Animation = spinner,
+                 step: float = 0.1,
+                 stream: Optional[TextIO] = None,
+                 **animation_kwargs):
+        """
+        Args:
+            path: Path to the Unix domain socket to listen on. A stale socket
+            at this path (i.e. one that no server is listening on) is
+            removed.
+            animation: A seekable animation (i.e. one that has a
+            ``frame_at`` attribute), rendered once per client.
+            step: Seconds between each frame.
+            stream: The stream to render to. Defaults to sys.stdout.
+            animation_kwargs: Keyword arguments for the animation.
+        """
+        if not hasattr(animation, 'frame_at'):
+            raise TypeError("animation {!r} is not seekable".format(
+                getattr(animation, '__name__', animation)))
+        self._path = path
+        self._animation = animation
+        self._animation_kwargs = animation_kwargs
+        self._step = step
+        self._stream = stream
+        self._statuses = {}
+        self._connections = {}
+        self._client_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._index = 0
+        self._height = 0
+        self._server = None
+        self._threads = []
+
+    @property
+    def path(self) -> str:
+        """The path of the Unix domain socket."""
+        return self._path
+
+    @property
+    def statuses(self):
+        """A list of the current client statuses, in connection order."""
+        with self._lock:
+            return [status for status in self._statuses.values()
+                    if status is not None]
+
+    def start(self):
+        """Start accepting clients and rendering frames in background
+        threads.
+
+        Raises:
+            FileExistsError if another server is listening on the path, or if
+            there is something other than a socket at the path.
+        """
+        _remove_stale_socket(self._path)
+        self._server = _UnixServer(self._path, self)
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._server.serve_forever, daemon=True),
+            threading.Thread(target=self._render_loop, daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """Stop the server, disconnect all clients, erase the rendered frame
+        and remove the socket. Does nothing if the server is not running.
+        """
+        if self._server is None:
+            return
+        self._stop_event.set()
+        self._server.shutdown()
+        self._server.server_close()
+        for thread in self._threads:
+            thread.join()
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections = {}
+            self._statuses = {}
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:  # the client already disconnected
+                pass
+        self._server = None
+        self._threads = []
+        with self._render_lock:
+            self._write(ERASE_DOWN)
+            self._height = 0
+            self._index = 0
+        try:
+            os.unlink(self._path)
+        except FileNotFoundError:
+            pass
+
+    def render(self) -> str:
+        """Return the next frame, including the cursor control characters
+        that erase what was previously rendered and return the cursor to the
+        top left corner of the frame. Lines are clipped to the terminal width,
+        as a wrapped line would throw off the cursor back up.
+        """
+        # the last column is left empty, as writing to it may wrap the cursor
+        max_width = max(1, terminal.get_terminal_info().columns - 1)
+        with self._render_lock:
+            lines = []
+            for status in self.statuses:
+                lines.extend(line[:max_width]
+                             for line in self._render_client(status))
+            self._index += 1
+            height = len(lines)
+            if not lines:
+                frame = ERASE_DOWN if self._height else ''
+            else:
+                frame = ((ERASE_LINE + '\n').join(lines) + ERASE_LINE
+                         + ERASE_DOWN + BACKLINE * (height - 1) + '\r')
+            self._height = height
+        return frame
+
+    def _render_client(self, status):
+        frame = self._animation.frame_at(self._index,
+                                         **self._animation_kwargs)
+        first, *rest = frame.split('\n')
+        return [first + ' ' + status] + rest
+
+    def _render_loop(self):
+        while not self._stop_event.wait(self._step):
+            frame = self.render()
+            if frame:
+                self._write(frame)
+
+    def _write(self, frame):
+        stream = self._stream or sys.stdout
+        stream.write(frame)
+        stream.flush()
+
+    def _connect(self, connection):
+        """Register a client connection.
+
+        Returns:
+            an id for the client, or None if the server is stopping.
+        """
+        with self._lock:
+            if self._stop_event.is_set():
+                return None
+            client = next(self._client_ids)
+            self._statuses[client] = None
+            self._connections[client] = connection
+        return client
+
+    def _update(self, client, status):
+        with self._lock:
+            if client in self._statuses:
+                self._statuses[client] = status
+
+    def _disconnect(self, client):
+        with self._lock:
+            self._statuses.pop(client, None)
+            self._connections.pop(client, None)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class FrameClient:
+    """A client for the :py:class:`FrameServer`.
+
+    .. code-block:: python
+
+        with FrameClient('/tmp/clanim.sock') as client:
+            client.update('Crunching numbers')
+            crunch_numbers()
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Path to the Unix domain socket of the frame server.
+        """
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(path)
+
+    def update(self, status: str):
+        """Set the status that is rendered next to this client's animation.
+
+        Args:
+            status: A single line status message.
+        """
+        message = json.dumps({'status': status}) + '\n'
+        self._socket.sendall(message.encode('utf-8'))
+
+    def close(self):
+        """Disconnect from the server, which removes this client's
+        animation.
+        """
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _sanitize(status):
+    """Turn a status into a single line of printable characters, so that a
+    client cannot break the layout or send control sequences to the terminal.
+    """
+    line = ' '.join(str(status).splitlines())
+    return ''.join(char for char in line if char.isprintable())
+
+
+def _remove_stale_socket(path):
+    """Remove a socket left behind at the given path, if any. A socket is only
+    considered stale if connecting to it is refused.
+
+    Raises:
+        FileExistsError if a server is listening on the socket, or if there
+        is something other than a socket at the path.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError("{} exists and is not a socket".format(path))
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError as exc:
+            if exc.errno != errno.ECONNREFUSED:
+                raise
+        else:
+            raise FileExistsError(
+                "a server is already listening on {}".format(path))
+    os.unlink(path)
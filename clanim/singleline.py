@@ -6,12 +6,80 @@
 .. moduleauthor:: Simon Larsén <slarse@kth.se>
 """
 import itertools
+from typing import Optional
 from clanimtk import animation
 from clanimtk import types
+from clanim.seek import seekable
+from clanim.terminal import default_width, resolve_width
 
+CHAR_WAVE_WIDTH = 10
+CHAR_WAVE_MIN_WIDTH = 2
+ARROW_WIDTH = 5
+ARROW_MIN_WIDTH = 2
+SPINNER_WIDTH = 10
+SPINNER_MIN_WIDTH = 1
 
+
+def _check_char_wave_args(char, width):
+    if len(char) != 1:
+        raise ValueError("The argument 'char' must be a single character, and "
+                         "not a string of length {}".format(len(char)))
+    if width <= 1:
+        raise ValueError("width must be greater than 1")
+
+
+def _char_wave_period(char: str = '#', width: Optional[int] = None) -> int:
+    width = resolve_width(width, CHAR_WAVE_WIDTH, CHAR_WAVE_MIN_WIDTH)
+    _check_char_wave_args(char, width)
+    return 2 * (width - 1)
+
+
+def _char_wave_frame_at(index: int,
+                        char: str = '#',
+                        width: Optional[int] = None) -> str:
+    width = resolve_width(width, CHAR_WAVE_WIDTH, CHAR_WAVE_MIN_WIDTH)
+    index %= _char_wave_period(char, width)
+    num_chars = index + 1 if index < width - 1 else 2 * width - 1 - index
+    return (char * num_chars).ljust(width)
+
+
+def _arrow_period(width: Optional[int] = None) -> int:
+    width = resolve_width(width, ARROW_WIDTH, ARROW_MIN_WIDTH)
+    if width <= 1:
+        raise ValueError("width must be greater than 1")
+    return 2 * (width - 1)
+
+
+def _arrow_frame_at(index: int, width: Optional[int] = None) -> str:
+    width = resolve_width(width, ARROW_WIDTH, ARROW_MIN_WIDTH)
+    index %= _arrow_period(width)
+    padding = width - 1
+    if index < padding:
+        return ' ' * index + '>' + ' ' * (padding - index)
+    index -= padding
+    return ' ' * (padding - index) + '<' + ' ' * index
+
+
+def _spinner_period(width: Optional[int] = None) -> int:
+    width = resolve_width(width, SPINNER_WIDTH, SPINNER_MIN_WIDTH)
+    if width <= 0:
+        raise ValueError("width must be greater than 0")
+    return 4 * width
+
+
+def _spinner_frame_at(index: int, width: Optional[int] = None) -> str:
+    width = resolve_width(width, SPINNER_WIDTH, SPINNER_MIN_WIDTH)
+    index %= _spinner_period(width)
+    spinner_pos = index // 4
+    return (' ' * spinner_pos + '\\|/-'[index % 4] +
+            ' ' * (width - 1 - spinner_pos))
+
+
+@seekable(frame_at=_char_wave_frame_at, period=_char_wave_period)
+@default_width(CHAR_WAVE_WIDTH, CHAR_WAVE_MIN_WIDTH)
 @animation
-def char_wave(char: str = '#', width: int = 10) -> types.FrameFunction:
+def char_wave(char: str = '#',
+              width: Optional[int] = None) -> types.FrameFunction:
     """Create a generator that cycles a wave of the given char. The animation is
     padded with whitespace to make its width constant. As an example if the char
     given is '#', and the width is 4, then the animation will look like this
@@ -30,23 +98,19 @@ def char_wave(char: str = '#', width: int = 10) -> types.FrameFunction:
     Args:
         char: A single character, the character to make up the animation.
         width: Total width of the animation (this is constant). This must
-        be greater than 1.
+        be greater than 1. Defaults to 10, clipped to the terminal width.
     Returns:
         a FrameFunction (or an Animation if annotated with ``@animation``)
     """
-    if len(char) != 1:
-        raise ValueError("The argument 'char' must be a single character, and "
-                         "not a string of length {}".format(len(char)))
-    if width <= 1:
-        raise ValueError("width must be greater than 1")
-    increasing = ((char * n).ljust(width) for n in range(1, width))
-    decreasing = ((char * n).ljust(width) for n in range(width, 1, -1))
-    wave = itertools.chain(increasing, decreasing)
-    return itertools.cycle(wave)
+    period = _char_wave_period(char, width)
+    return itertools.cycle([_char_wave_frame_at(index, char, width)
+                            for index in range(period)])
 
 
+@seekable(frame_at=_arrow_frame_at, period=_arrow_period)
+@default_width(ARROW_WIDTH, ARROW_MIN_WIDTH)
 @animation
-def arrow(width: int = 5) -> types.FrameFunction:
+def arrow(width: Optional[int] = None) -> types.FrameFunction:
     """Create a generator that cycles an arrow moving back and forth. The
     animation is padded with whitespace to make the width constant. As an
     example, if the width is 4, the animation looks like this (note that
@@ -63,21 +127,19 @@ def arrow(width: int = 5) -> types.FrameFunction:
 
     Args:
         width: Total width of the animation (this is constant). This must
-        be greater than 1.
+        be greater than 1. Defaults to 5, clipped to the terminal width.
     Returns:
         a FrameFunction (or an Animation if annotated with ``@animation``)
     """
-    if width <= 1:
-        raise ValueError("width must be greater than 1")
-    padding = width - 1
-    right_arrows = (' ' * i + '>' + ' ' * (padding - i)
-                    for i in range(padding))
-    left_arrows = (' ' * (padding - i) + '<' + ' ' * i for i in range(padding))
-    return itertools.cycle(itertools.chain(right_arrows, left_arrows))
+    period = _arrow_period(width)
+    return itertools.cycle([_arrow_frame_at(index, width)
+                            for index in range(period)])
 
 
+@seekable(frame_at=_spinner_frame_at, period=_spinner_period)
+@default_width(SPINNER_WIDTH, SPINNER_MIN_WIDTH)
 @animation
-def spinner(width: int = 10) -> types.FrameFunction:
+def spinner(width: Optional[int] = None) -> types.FrameFunction:
     r"""Create a generator that yields strings for a spinner animation. The
     strings are padded with whitespace to make the width constant. A spinner
     of width 4 will look like this:
@@ -99,18 +161,11 @@ def spinner(width: int = 10) -> types.FrameFunction:
         ___\
 
     Args:
-        width: The width of the animation.
+        width: The width of the animation. Defaults to 10, clipped to the
+        terminal width.
     Returns:
         a FrameFunction (or an Animation if annotated with ``@animation``)
     """
-    if width <= 0:
-        raise ValueError("width must be greater than 0")
-    spinner_ = itertools.cycle(['\\', '|', '/', '-'])
-    spinner_pos = 0
-    padding = width - 1
-    while True:
-        left_padding = ' ' * (spinner_pos // 4)
-        right_padding = ' ' * (padding - spinner_pos // 4)
-        frame = left_padding + next(spinner_) + right_padding
-        spinner_pos = (spinner_pos + 1) % (width * 4)
-        yield frame
+    period = _spinner_period(width)
+    return itertools.cycle([_spinner_frame_at(index, width)
+                            for index in range(period)])
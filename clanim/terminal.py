@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: terminal
+    :platform: Unix
+    :synopsis: Cached information about the terminal that animations are
+        rendered to.
+.. moduleauthor:: Simon Larsén <slarse@kth.se>
+
+Looking up the terminal size and capabilities requires an ``ioctl`` and
+several environment lookups, which adds up when it is done for every animated
+call. The information is therefore detected once and cached until the
+terminal is resized (``SIGWINCH``), or until :py:func:`refresh` is called.
+"""
+import collections
+import functools
+import inspect
+import os
+import shutil
+import signal
+import sys
+import threading
+from typing import Optional
+
+TerminalInfo = collections.namedtuple('TerminalInfo',
+                                      'columns lines colors unicode isatty')
+TerminalInfo.__doc__ = """Size and capabilities of the terminal.
+
+Attributes:
+    columns: Width of the terminal in cells.
+    lines: Height of the terminal in cells.
+    colors: The amount of colors that the terminal supports, 0 if colors
+    should not be used.
+    unicode: True if the output encoding can represent any unicode character.
+    isatty: True if the output is a terminal.
+"""
+
+TRUE_COLOR = 2**24
+
+_lock = threading.Lock()
+_cached_info = None
+_sigwinch_handler_installed = False
+
+
+def get_terminal_info() -> TerminalInfo:
+    """Return information about the terminal that sys.stdout is connected to.
+    The information is cached, and the cache is invalidated when the terminal
+    is resized.
+
+    .. note::
+
+        Resizes can only be detected if this function is first called from
+        the main thread. Otherwise, :py:func:`refresh` must be called to pick
+        up a new terminal size.
+    """
+    info = _cached_info
+    if info is None:
+        info = _detect_and_cache()
+    return info
+
+
+def refresh() -> TerminalInfo:
+    """Detect the terminal information anew, and return it."""
+    invalidate()
+    return get_terminal_info()
+
+
+def invalidate():
+    """Invalidate the cached terminal information. This is safe to call from
+    a signal handler.
+    """
+    global _cached_info
+    _cached_info = None
+
+
+def resolve_width(width: Optional[int], default: int, minimum: int = 1) -> int:
+    """Resolve the width of an animation.
+
+    Args:
+        width: The width given to the animation, or None.
+        default: The preferred width of the animation.
+        minimum: The smallest width that the animation supports. The resolved
+        default width is never narrower than this, even if the terminal is.
+    Returns:
+        width if it is not None, otherwise the default width clipped to fit
+        the terminal.
+    """
+    if width is not None:
+        return width
+    # the last column is left empty, as writing to it may wrap the cursor
+    return max(minimum, min(default, get_terminal_info().columns - 1))
+
+
+def default_width(default: int, minimum: int = 1):
+    """Decorator for animations with a ``width`` parameter that defaults to
+    None. When the animation is created without a width, the width is
+    resolved with :py:func:`resolve_width` and passed on explicitly. The
+    Animation therefore keeps the same width when it is reset, even if the
+    terminal has been resized since. Otherwise, its frames and its cursor
+    back up (which is computed once) would no longer match.
+
+    .. code-block:: python
+
+        @default_width(10, minimum=1)
+        @animation
+        def spinner(width=None):
+            ...
+
+    Args:
+        default: The preferred width of the animation.
+        minimum: The smallest width that the animation supports.
+    Returns:
+        a decorator for animations.
+    """
+    def decorator(animation_):
+        signature = inspect.signature(animation_)
+
+        @functools.wraps(animation_)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            if bound.arguments.get('width') is None:
+                bound.arguments['width'] = resolve_width(None, default,
+                                                         minimum)
+            return animation_(*bound.args, **bound.kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _detect_and_cache():
+    global _cached_info
+    with _lock:
+        _install_sigwinch_handler()
+        info = _cached_info = _detect()
+    return info
+
+
+def _detect():
+    stream = sys.stdout
+    isatty = _isatty(stream)
+    columns, lines = shutil.get_terminal_size()
+    encoding = getattr(stream, 'encoding', None) or ''
+    return TerminalInfo(columns=columns,
+                        lines=lines,
+                        colors=_color_depth(isatty, os.environ),
+                        unicode='utf' in encoding.lower(),
+                        isatty=isatty)
+
+
+def _isatty(stream):
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):  # no stream, or a closed one
+        return False
+
+
+def _color_depth(isatty, environ):
+    term = environ.get('TERM', '')
+    if not isatty or 'NO_COLOR' in environ or term == 'dumb':
+        return 0
+    if environ.get('COLORTERM', '').lower() in ('truecolor', '24bit'):
+        return TRUE_COLOR
+    if '256' in term:
+        return 256
+    return 8
+
+
+def _install_sigwinch_handler():
+    """Install a SIGWINCH handler that invalidates the cache, and then calls
+    any previously installed handler. Signal handlers can only be installed
+    from the main thread, so this is a no-op in other threads.
+    """
+    global _sigwinch_handler_installed
+    if (_sigwinch_handler_installed or not hasattr(signal, 'SIGWINCH')
+            or threading.current_thread() is not threading.main_thread()):
+        return
+    previous_handler = signal.getsignal(signal.SIGWINCH)
+
+    def handler(signum, frame):
+        invalidate()
+        if callable(previous_handler):
+            previous_handler(signum, frame)
+
+    signal.signal(signal.SIGWINCH, handler)
+    _sigwinch_handler_installed = True
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+# pylint: disable=invalid-name
+# pylint: disable=missing-docstring
+# pylint: disable=wrong-import-order
+"""unit tests for the aio module.
+
+Author: Simon Larsén
+"""
+import asyncio
+import itertools
+import unittest
+from .context import clanim
+from clanim import aio
+from clanim import alnum
+from clanim import singleline
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def take(async_frames, num_frames):
+    frames = []
+    async for frame in async_frames:
+        frames.append(frame)
+        if len(frames) == num_frames:
+            break
+    return frames
+
+
+class PacedTest(unittest.TestCase):
+
+    def test_yields_animation_frames(self):
+        expected = list(itertools.islice(singleline.arrow(width=3), 6))
+        actual = run(take(aio.paced(singleline.arrow(width=3), step=0), 6))
+        self.assertEqual(expected, actual)
+
+    def test_stops_with_finite_frames(self):
+        expected = list(alnum.big_message('Hi', 12))
+        actual = run(take(aio.paced(alnum.big_message('Hi', 12), step=0),
+                          -1))
+        self.assertEqual(expected, actual)
+
+    def test_frames_are_paced(self):
+        step = 0.02
+        num_frames = 5
+
+        async def timed():
+            loop = aio._get_running_loop()
+            start = loop.time()
+            await take(aio.paced(singleline.spinner(width=3), step=step),
+                       num_frames)
+            return loop.time() - start
+
+        elapsed = run(timed())
+        self.assertGreaterEqual(elapsed, (num_frames - 1) * step * 0.9)
+
+    def test_zero_step_does_not_block_loop(self):
+        ticks = []
+        num_frames = 100
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.ensure_future(ticker())
+            await take(aio.paced(singleline.spinner(width=3), step=0),
+                       num_frames)
+            task.cancel()
+
+        run(main())
+        self.assertGreaterEqual(len(ticks), num_frames - 1)
+
+    def test_pacing_does_not_block_loop(self):
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.ensure_future(ticker())
+            await take(aio.paced(singleline.spinner(width=3), step=0.01), 3)
+            task.cancel()
+
+        run(main())
+        self.assertGreater(len(ticks), 1)
+
+    def test_raises_with_negative_step(self):
+        with self.assertRaises(ValueError):
+            aio.paced(singleline.spinner(width=3), step=-1)
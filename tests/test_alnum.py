@@ -10,6 +10,7 @@ Author: Simon Larsén
 import unittest
 from .context import clanim
 from clanim import alnum
+from clanim import big_char
 
 class AlnumTest(unittest.TestCase):
 
@@ -163,3 +164,72 @@ class AlnumTest(unittest.TestCase):
         for expected_frame in expected_frames:
             self.assertEqual(expected_frame, next(msg_gen))
         self.assertRaises(StopIteration, msg_gen.__next__)
+
+    def test_big_message_frame_at_matches_generator(self):
+        msg = 'Hello, world!'
+        for width in [9, 15, 50]:
+            frames = list(alnum.big_message(msg, width))
+            self.assertEqual(len(frames), alnum.big_message_period(msg, width))
+            for index, frame in enumerate(frames):
+                self.assertEqual(frame,
+                                 alnum.big_message_frame_at(index, msg, width))
+
+    def test_big_message_frame_at_wraps_around(self):
+        msg = 'Hi'
+        period = alnum.big_message_period(msg, 12)
+        self.assertEqual(alnum.big_message_frame_at(3, msg, 12),
+                         alnum.big_message_frame_at(period + 3, msg, 12))
+
+
+class MessageQueueTest(unittest.TestCase):
+
+    def test_empty_queue_has_no_columns(self):
+        self.assertIsNone(alnum.MessageQueue().next_column())
+
+    def test_columns_are_rendered_with_separator(self):
+        queue = alnum.MessageQueue('I')
+        columns = [queue.next_column() for _ in range(7)]
+        self.assertEqual(list(zip(*big_char._I)), columns[:5])
+        self.assertEqual([(' ',)*5]*2, columns[5:])
+        self.assertIsNone(queue.next_column())
+
+    def test_put_appends_to_stream(self):
+        queue = alnum.MessageQueue('I')
+        queue.put('T')
+        columns = [queue.next_column() for _ in range(14)]
+        self.assertEqual(list(zip(*big_char._T)), columns[7:12])
+
+    def test_replace_finishes_current_char(self):
+        queue = alnum.MessageQueue('IO')
+        queue.next_column()
+        queue.replace('T')
+        columns = [queue.next_column() for _ in range(13)]
+        self.assertEqual(list(zip(*big_char._I))[1:], columns[:4])
+        self.assertEqual(list(zip(*big_char._T)), columns[6:11])
+        self.assertIsNone(queue.next_column())
+
+    def test_put_raises_for_unsupported_char(self):
+        queue = alnum.MessageQueue()
+        with self.assertRaises(ValueError):
+            queue.put('#')
+
+    def test_live_big_message_matches_big_message(self):
+        msg = 'Hi'
+        width = 12
+        frames = alnum.big_message(msg, width)
+        live_frames = alnum.live_big_message(alnum.MessageQueue(msg), width)
+        self.assertEqual(' '*width, next(live_frames).split('\n')[0])
+        for expected, actual in zip(frames, live_frames):
+            self.assertEqual(expected, actual)
+
+    def test_live_big_message_scrolls_in_new_messages(self):
+        queue = alnum.MessageQueue()
+        width = 9
+        frames = alnum.live_big_message(queue, width)
+        for _ in range(3):
+            self.assertEqual('\n'.join([' '*width]*5), next(frames))
+        queue.put('I')
+        for _ in range(5):
+            frame = next(frames)
+        self.assertEqual(['    ' + line for line in big_char._I],
+                         frame.split('\n'))
@@ -11,6 +11,7 @@ import unittest
 from .context import clanim
 from clanim import singleline
 from clanim import multiline
+from clanim import alnum
 
 class AnimationTest(unittest.TestCase):
 
@@ -53,3 +54,65 @@ class AnimationTest(unittest.TestCase):
         for expected, actual in zip(
                 expected_sequence, singleline.arrow(width=width)):
             self.assertEqual(expected, actual)
+
+    def test_singleline_frame_at_matches_animation(self):
+        cases = [(singleline.spinner, dict(width=4)),
+                 (singleline.arrow, dict(width=5)),
+                 (singleline.char_wave, dict(char='*', width=4))]
+        for animation, kwargs in cases:
+            period = animation.period(**kwargs)
+            frames = animation(**kwargs)
+            for index in range(2 * period + 1):
+                expected = next(frames).rstrip('\x08')
+                self.assertEqual(expected, animation.frame_at(index, **kwargs))
+
+    def test_singleline_periods(self):
+        self.assertEqual(16, singleline.spinner.period(width=4))
+        self.assertEqual(8, singleline.arrow.period(width=5))
+        self.assertEqual(6, singleline.char_wave.period(width=4))
+
+    def test_frame_at_raises_with_too_small_width(self):
+        with self.assertRaises(ValueError):
+            singleline.spinner.frame_at(0, width=0)
+        with self.assertRaises(ValueError):
+            singleline.arrow.frame_at(0, width=1)
+        with self.assertRaises(ValueError):
+            multiline.scrolling_text.frame_at(0, 'Hi', width=8)
+
+    def test_scrolling_text_frame_at_matches_animation(self):
+        msg = 'Hi'
+        width = 12
+        period = multiline.scrolling_text.period(msg, width=width)
+        frames = multiline.scrolling_text(msg, width=width)
+        back_up = '\033[F' * 4
+        for index in range(2 * period + 1):
+            frame = next(frames)
+            self.assertTrue(frame.endswith(back_up))
+            self.assertEqual(frame[:-len(back_up)],
+                             multiline.scrolling_text.frame_at(
+                                 index, msg, width=width))
+
+    def test_stacked_multiline_frame_at_leaves_out_line_backspaces(self):
+        # spinners and arrows stack singleline Animations, which end each
+        # line with backspaces that frame_at does not include
+        cases = [(multiline.spinners, dict(width=4, height=2)),
+                 (multiline.arrows, dict(width=3, height=3))]
+        for animation, kwargs in cases:
+            width = kwargs['width']
+            frames = animation(**kwargs)
+            for index in range(2 * animation.period(**kwargs) + 1):
+                frame = next(frames)
+                back_up = '\033[F' * (kwargs['height'] - 1)
+                lines = frame[:len(frame) - len(back_up)].split('\n')
+                expected = [line + '\x08' * width for line in
+                            animation.frame_at(index, **kwargs).split('\n')]
+                self.assertEqual(expected, lines)
+
+    def test_live_scrolling_text_raises_with_too_small_width(self):
+        with self.assertRaises(ValueError):
+            next(multiline.live_scrolling_text(alnum.MessageQueue(), width=8))
+
+    def test_live_scrolling_text_does_not_consume_queue_on_creation(self):
+        queue = alnum.MessageQueue('I')
+        multiline.live_scrolling_text(queue, width=9)
+        self.assertEqual(tuple('X   X'), queue.next_column())
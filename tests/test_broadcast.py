@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+# pylint: disable=invalid-name
+# pylint: disable=missing-docstring
+# pylint: disable=wrong-import-order
+"""unit tests for the broadcast module.
+
+Author: Simon Larsén
+"""
+import itertools
+import queue
+import threading
+import unittest
+from .context import clanim
+from clanim import alnum
+from clanim import broadcast
+from clanim import singleline
+
+
+class BroadcastTest(unittest.TestCase):
+
+    def test_frames_are_computed_once_for_all_subscribers(self):
+        computed = []
+
+        def frames():
+            for frame in singleline.arrow(width=3):
+                computed.append(frame)
+                yield frame
+
+        broadcast_ = broadcast.Broadcast(frames())
+        subscriptions = [broadcast_.subscribe() for _ in range(3)]
+        for _ in range(4):
+            broadcast_.publish()
+        self.assertEqual(4, len(computed))
+        for subscription in subscriptions:
+            self.assertEqual(computed,
+                             [subscription.get(timeout=0) for _ in range(4)])
+
+    def test_slow_subscriber_drops_oldest_frames(self):
+        broadcast_ = broadcast.Broadcast(itertools.count())
+        slow = broadcast_.subscribe(maxsize=2)
+        fast = broadcast_.subscribe(maxsize=2)
+        for _ in range(5):
+            broadcast_.publish()
+            fast.get(timeout=0)
+        self.assertEqual(3, slow.get(timeout=0))
+        self.assertEqual(4, slow.get(timeout=0))
+        self.assertEqual(3, slow.dropped)
+        self.assertEqual(0, fast.dropped)
+
+    def test_get_raises_on_timeout(self):
+        subscription = broadcast.Broadcast(iter([])).subscribe()
+        with self.assertRaises(queue.Empty):
+            subscription.get(timeout=0)
+
+    def test_exhausted_animation_closes_subscriptions(self):
+        msg_frames = list(alnum.big_message('Hi', 12))
+        broadcast_ = broadcast.Broadcast(alnum.big_message('Hi', 12))
+        subscription = broadcast_.subscribe(maxsize=len(msg_frames))
+        while broadcast_.publish() is not None:
+            pass
+        self.assertTrue(subscription.closed)
+        self.assertEqual(msg_frames, list(subscription))
+        self.assertTrue(broadcast_.subscribe().closed)
+
+    def test_unsubscribe_stops_delivery(self):
+        broadcast_ = broadcast.Broadcast(itertools.count())
+        subscription = broadcast_.subscribe()
+        broadcast_.publish()
+        broadcast_.unsubscribe(subscription)
+        broadcast_.publish()
+        self.assertEqual([0], list(subscription))
+
+    def test_unsubscribe_after_close(self):
+        broadcast_ = broadcast.Broadcast(itertools.count())
+        subscription = broadcast_.subscribe()
+        broadcast_.publish()
+        broadcast_.close()
+        broadcast_.unsubscribe(subscription)
+        self.assertEqual([0], list(subscription))
+
+    def test_unsubscribe_after_animation_is_exhausted(self):
+        broadcast_ = broadcast.Broadcast(iter([0]))
+        subscription = broadcast_.subscribe()
+        broadcast_.publish()
+        broadcast_.publish()
+        broadcast_.unsubscribe(subscription)
+        self.assertEqual([0], list(subscription))
+
+    def test_run_until_event_is_set(self):
+        broadcast_ = broadcast.Broadcast(singleline.spinner(width=3))
+        subscription = broadcast_.subscribe()
+        event = threading.Event()
+        thread = threading.Thread(target=broadcast_.run, args=(0.001, event))
+        thread.start()
+        first = subscription.get(timeout=5)
+        event.set()
+        thread.join()
+        self.assertEqual(next(singleline.spinner(width=3)), first)
+        self.assertTrue(subscription.closed)
+
+    def test_subscribe_raises_with_too_small_maxsize(self):
+        with self.assertRaises(ValueError):
+            broadcast.Broadcast(iter([])).subscribe(maxsize=0)
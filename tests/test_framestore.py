@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+# pylint: disable=invalid-name
+# pylint: disable=missing-docstring
+# pylint: disable=wrong-import-order
+"""unit tests for the framestore module.
+
+Author: Simon Larsén
+"""
+import os
+import unittest
+from .context import clanim
+from clanim import framestore
+from clanim import singleline
+
+
+class FrameStoreTest(unittest.TestCase):
+
+    def test_frames_round_trip(self):
+        frames = ['#  ', '## ', 'åäö', '\\\n|']
+        store = framestore.FrameStore(frames)
+        self.assertEqual(len(frames), len(store))
+        self.assertEqual(frames, list(store))
+        self.assertEqual(frames[-1], store[-1])
+
+    def test_view_is_encoded_frame(self):
+        store = framestore.FrameStore(['ab', 'åä'])
+        self.assertEqual(b'ab', bytes(store.view(0)))
+        self.assertEqual('åä'.encode('utf-8'), bytes(store.view(1)))
+        self.assertEqual(2 + 4, store.nbytes)
+
+    def test_index_out_of_range_raises(self):
+        store = framestore.FrameStore(['a', 'b'])
+        for index in [2, 100, -3]:
+            with self.assertRaises(IndexError):
+                store.view(index)
+
+    def test_empty_store(self):
+        store = framestore.FrameStore([])
+        self.assertEqual(0, len(store))
+        self.assertEqual([], list(store))
+
+    def test_write_to_fd(self):
+        animation = singleline.arrow(width=3)
+        frames = [next(animation) for _ in range(4)]
+        store = framestore.FrameStore(frames)
+        read_fd, write_fd = os.pipe()
+        try:
+            written = sum(store.write(write_fd, i) for i in range(len(store)))
+            self.assertEqual(store.nbytes, written)
+            self.assertEqual(''.join(frames),
+                             os.read(read_fd, written).decode('utf-8'))
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_views_are_cached(self):
+        store = framestore.FrameStore(['ab', 'cd'])
+        views = store.views()
+        self.assertIs(views, store.views())
+        self.assertEqual([b'ab', b'cd'], [bytes(view) for view in views])
+
+    def test_write_all_accepts_bytes_and_views(self):
+        store = framestore.FrameStore(['ab'])
+        read_fd, write_fd = os.pipe()
+        try:
+            self.assertEqual(1, framestore.write_all(write_fd, b'xy'))
+            self.assertEqual(1, framestore.write_all(write_fd,
+                                                     store.view(0)))
+            self.assertEqual(b'xyab', os.read(read_fd, 4))
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
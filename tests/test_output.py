@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+# pylint: disable=invalid-name
+# pylint: disable=missing-docstring
+# pylint: disable=wrong-import-order
+"""unit tests for the output module.
+
+Author: Simon Larsén
+"""
+import os
+import threading
+import unittest
+from .context import clanim
+from clanim import output
+from clanim import singleline
+from clanim import multiline
+
+
+class EncodedAnimationTest(unittest.TestCase):
+
+    def test_frames_match_animation(self):
+        # see test_stacked_multiline_frames_leave_out_line_backspaces for
+        # spinners and arrows
+        cases = [(singleline.arrow, (), dict(width=4)),
+                 (singleline.spinner, (), dict(width=3)),
+                 (multiline.scrolling_text, ('Hi',), dict(width=12))]
+        for animation, args, kwargs in cases:
+            encoded = output.EncodedAnimation(animation, *args, **kwargs)
+            frames = animation(*args, **kwargs)
+            self.assertEqual(animation.period(*args, **kwargs),
+                             len(encoded.frames))
+            for frame in encoded.frames:
+                self.assertEqual(next(frames), frame)
+
+    def test_stacked_multiline_frames_leave_out_line_backspaces(self):
+        # the Animation ends each line of spinners and arrows with
+        # backspaces, which are not needed when the frame is pre-encoded
+        cases = [(multiline.spinners, dict(width=3, height=2)),
+                 (multiline.arrows, dict(width=4, height=3))]
+        for animation, kwargs in cases:
+            encoded = output.EncodedAnimation(animation, **kwargs)
+            frames = animation(**kwargs)
+            back_up = '\033[F' * (kwargs['height'] - 1)
+            line_backspaces = '\x08' * kwargs['width']
+            for frame in encoded.frames:
+                lines = next(frames)[:-len(back_up)].split('\n')
+                self.assertTrue(all(line.endswith(line_backspaces)
+                                    for line in lines))
+                expected = '\n'.join(line[:-len(line_backspaces)]
+                                      for line in lines) + back_up
+                self.assertEqual(expected, frame)
+
+    def test_raises_for_non_seekable_animation(self):
+        with self.assertRaises(TypeError):
+            output.EncodedAnimation(multiline.char_waves)
+
+    def test_erase_frame(self):
+        self.assertEqual(b'   \x08\x08\x08',
+                         output.EncodedAnimation(singleline.arrow,
+                                                 width=3).erase_frame)
+        self.assertEqual(b'  \n  \033[F',
+                         output.EncodedAnimation(multiline.spinners,
+                                                 width=2,
+                                                 height=2).erase_frame)
+
+    def test_play_writes_frame_then_erases(self):
+        encoded = output.EncodedAnimation(singleline.arrow, width=3)
+        event = threading.Event()
+        event.set()
+        read_fd, write_fd = os.pipe()
+        try:
+            encoded.play(step=0, event=event, fd=write_fd)
+            self.assertEqual(b'>  \x08\x08\x08   \x08\x08\x08',
+                             os.read(read_fd, 1024))
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_animate_stops_when_function_returns(self):
+        encoded = output.EncodedAnimation(singleline.arrow, width=3)
+        read_fd, write_fd = os.pipe()
+
+        @output.animate(encoded, step=0.001, fd=write_fd)
+        def func(value):
+            return value
+
+        try:
+            self.assertEqual(42, func(42))
+            written = os.read(read_fd, 1 << 16)
+            self.assertTrue(written.startswith(bytes(encoded.frames.view(0))))
+            self.assertTrue(written.endswith(encoded.erase_frame))
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
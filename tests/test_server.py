@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+# pylint: disable=invalid-name
+# pylint: disable=missing-docstring
+# pylint: disable=wrong-import-order
+"""unit tests for the server module.
+
+Author: Simon Larsén
+"""
+import io
+import os
+import socket
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from .context import clanim
+from clanim import server
+from clanim import terminal
+from clanim import singleline
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for the frame server")
+        time.sleep(0.01)
+
+
+class FrameServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'clanim.sock')
+        self.stream = io.StringIO()
+        # long step so that the render loop does not interfere with the tests
+        self.frame_server = server.FrameServer(
+            self.path, animation=singleline.arrow, step=60,
+            stream=self.stream, width=3)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_raises_for_non_seekable_animation(self):
+        with self.assertRaises(TypeError):
+            server.FrameServer(self.path, animation=lambda: None)
+
+    def test_status_updates_are_rendered(self):
+        with self.frame_server:
+            with server.FrameClient(self.path) as first, \
+                    server.FrameClient(self.path) as second:
+                first.update('first')
+                second.update('second')
+                wait_for(lambda: len(self.frame_server.statuses) == 2)
+                frame = self.frame_server.render()
+        self.assertEqual(
+            '>   first\033[K\n>   second\033[K\033[J\033[F\r', frame)
+
+    def test_lines_are_clipped_to_terminal_width(self):
+        info = terminal.TerminalInfo(columns=10, lines=24, colors=0,
+                                     unicode=True, isatty=False)
+        with patch('clanim.terminal.get_terminal_info', return_value=info):
+            with self.frame_server:
+                with server.FrameClient(self.path) as client:
+                    client.update('a very long status message')
+                    wait_for(lambda: len(self.frame_server.statuses) == 1)
+                    frame = self.frame_server.render()
+        self.assertEqual('>   a ver\033[K\033[J\r', frame)
+
+    def test_control_characters_are_dropped(self):
+        with self.frame_server:
+            with server.FrameClient(self.path) as client:
+                client.update('a\tb\x1b[2J\x08\x08x\nc')
+                wait_for(lambda: self.frame_server.statuses == ['ab[2Jx c'])
+
+    def test_stop_disconnects_clients(self):
+        self.frame_server.start()
+        with server.FrameClient(self.path) as client:
+            client.update('x')
+            wait_for(lambda: self.frame_server.statuses == ['x'])
+            self.frame_server.stop()
+            self.assertEqual([], self.frame_server.statuses)
+            self.assertEqual(b'', client._socket.recv(1))
+            self.frame_server.start()
+            try:
+                self.assertEqual([], self.frame_server.statuses)
+                self.assertEqual('', self.frame_server.render())
+            finally:
+                self.frame_server.stop()
+
+    def test_status_is_replaced_by_update(self):
+        with self.frame_server:
+            with server.FrameClient(self.path) as client:
+                client.update('compiling')
+                wait_for(lambda: self.frame_server.statuses == ['compiling'])
+                client.update('linking')
+                wait_for(lambda: self.frame_server.statuses == ['linking'])
+
+    def test_disconnected_client_is_erased(self):
+        with self.frame_server:
+            with server.FrameClient(self.path) as client:
+                client.update('working')
+                wait_for(lambda: self.frame_server.statuses == ['working'])
+                self.frame_server.render()
+            wait_for(lambda: self.frame_server.statuses == [])
+            self.assertEqual('\033[J', self.frame_server.render())
+            self.assertEqual('', self.frame_server.render())
+
+    def test_stop_removes_socket(self):
+        with self.frame_server:
+            self.assertTrue(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_refuses_to_take_over_running_server(self):
+        other = server.FrameServer(self.path, stream=io.StringIO(), step=60)
+        with self.frame_server:
+            with self.assertRaises(FileExistsError):
+                other.start()
+            with server.FrameClient(self.path) as client:
+                client.update('still here')
+                wait_for(lambda: self.frame_server.statuses == ['still here'])
+
+    def test_removes_stale_socket(self):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(self.path)
+        stale.close()
+        with self.frame_server:
+            with server.FrameClient(self.path) as client:
+                client.update('working')
+                wait_for(lambda: self.frame_server.statuses == ['working'])
+
+    def test_stop_tolerates_missing_socket(self):
+        self.frame_server.start()
+        os.unlink(self.path)
+        self.frame_server.stop()
+
+    def test_stop_before_start_does_nothing(self):
+        self.frame_server.stop()
+        self.assertEqual('', self.stream.getvalue())
+
+    def test_refuses_to_remove_regular_file(self):
+        open(self.path, 'w').close()
+        with self.assertRaises(FileExistsError):
+            self.frame_server.start()
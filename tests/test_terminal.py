@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+# pylint: disable=invalid-name
+# pylint: disable=missing-docstring
+# pylint: disable=wrong-import-order
+"""unit tests for the terminal module.
+
+Author: Simon Larsén
+"""
+import os
+import signal
+import unittest
+from unittest.mock import patch
+from .context import clanim
+from clanim import terminal
+from clanim import singleline
+from clanim import multiline
+
+
+class TerminalTest(unittest.TestCase):
+
+    def setUp(self):
+        terminal.invalidate()
+        size_patcher = patch('shutil.get_terminal_size',
+                             return_value=os.terminal_size((30, 20)))
+        self.get_terminal_size = size_patcher.start()
+        self.addCleanup(size_patcher.stop)
+        self.addCleanup(terminal.invalidate)
+
+    def test_info_is_cached(self):
+        first = terminal.get_terminal_info()
+        second = terminal.get_terminal_info()
+        self.assertIs(first, second)
+        self.assertEqual(1, self.get_terminal_size.call_count)
+        self.assertEqual((30, 20), (first.columns, first.lines))
+
+    def test_refresh_detects_anew(self):
+        terminal.get_terminal_info()
+        self.get_terminal_size.return_value = os.terminal_size((40, 10))
+        self.assertEqual(30, terminal.get_terminal_info().columns)
+        self.assertEqual(40, terminal.refresh().columns)
+
+    @unittest.skipUnless(hasattr(signal, 'SIGWINCH'), 'requires SIGWINCH')
+    def test_sigwinch_invalidates_cache(self):
+        terminal.get_terminal_info()
+        self.get_terminal_size.return_value = os.terminal_size((40, 10))
+        os.kill(os.getpid(), signal.SIGWINCH)
+        self.assertEqual(40, terminal.get_terminal_info().columns)
+
+    def test_color_depth(self):
+        cases = [(False, {'TERM': 'xterm-256color'}, 0),
+                 (True, {'TERM': 'dumb'}, 0),
+                 (True, {'TERM': 'xterm', 'NO_COLOR': ''}, 0),
+                 (True, {'TERM': 'xterm', 'COLORTERM': 'truecolor'},
+                  terminal.TRUE_COLOR),
+                 (True, {'TERM': 'xterm-256color'}, 256),
+                 (True, {'TERM': 'xterm'}, 8)]
+        for isatty, environ, expected in cases:
+            self.assertEqual(expected, terminal._color_depth(isatty, environ))
+
+    def test_resolve_width(self):
+        self.assertEqual(50, terminal.resolve_width(50, 10))
+        self.assertEqual(10, terminal.resolve_width(None, 10))
+        self.assertEqual(29, terminal.resolve_width(None, 50))
+
+    def test_resolve_width_respects_minimum(self):
+        self.get_terminal_size.return_value = os.terminal_size((2, 20))
+        self.assertEqual(9, terminal.resolve_width(None, 50, minimum=9))
+        self.assertEqual(1, terminal.resolve_width(None, 10))
+
+    def test_default_widths_do_not_raise_on_narrow_terminal(self):
+        for columns in [1, 2, 8]:
+            self.get_terminal_size.return_value = os.terminal_size(
+                (columns, 20))
+            terminal.refresh()
+            next(singleline.spinner())
+            next(singleline.arrow())
+            next(singleline.char_wave())
+            next(multiline.spinners())
+            next(multiline.arrows())
+            next(multiline.scrolling_text('Hi'))
+            multiline.scrolling_text.frame_at(0, 'Hi')
+            singleline.arrow.frame_at(0)
+
+    def test_width_is_kept_when_animation_is_reset_after_resize(self):
+        self.get_terminal_size.return_value = os.terminal_size((80, 20))
+        terminal.refresh()
+        cases = [(singleline.spinner, (), '\x08' * 10),
+                 (singleline.arrow, (), '\x08' * 5),
+                 (multiline.spinners, (), None),
+                 (multiline.scrolling_text, ('Hi',), None)]
+        for animation, args, back_up in cases:
+            animation_ = animation(*args)
+            before = next(animation_)
+            self.get_terminal_size.return_value = os.terminal_size((6, 20))
+            terminal.refresh()
+            animation_.reset()
+            after = next(animation_)
+            self.assertEqual(before, after)
+            if back_up is not None:
+                self.assertTrue(after.endswith(back_up))
+                self.assertEqual(len(back_up), len(after) - len(back_up))
+            self.get_terminal_size.return_value = os.terminal_size((80, 20))
+            terminal.refresh()
+
+    def test_positional_width_is_not_overridden(self):
+        self.assertEqual('\\  ' + '\x08' * 3,
+                         next(singleline.spinner(3)))
+
+    def test_animations_default_width_to_terminal_width(self):
+        self.assertEqual(10, len(singleline.spinner.frame_at(0)))
+        frame = multiline.scrolling_text.frame_at(0, 'Hi')
+        self.assertEqual(29, len(frame.split('\n')[0]))
+        self.assertEqual(29, len(next(multiline.scrolling_text('Hi'))
+                                 .split('\n')[0]))